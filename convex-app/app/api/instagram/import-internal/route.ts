@@ -155,20 +155,26 @@ export async function POST(request: NextRequest) {
       console.log(`[Internal Import] Caption provided: ${caption.substring(0, 100)}...`);
     }
 
-    // STEP 1: Parse CAPTION first for title, ingredients, instructions (cheap text call)
-    let captionData = { title: null as string | null, ingredients: [] as string[], instructions: [] as string[] };
+    // STEP 1 + 2 run concurrently - neither call depends on the other, so the
+    // cheap caption parse overlaps the expensive video call instead of adding to it
+    // STEP 1: Parse CAPTION for title, ingredients, instructions (cheap text call)
+    let captionPromise: Promise<{ title: string | null; ingredients: string[]; instructions: string[] }>;
     if (caption && caption.trim().length > 0) {
       console.log('[Internal Import] Step 1: Parsing caption (cheap)...');
-      captionData = await parseCaption(caption);
+      captionPromise = parseCaption(caption); // Never rejects - returns empty data on failure
     } else {
       console.log('[Internal Import] Step 1: No caption provided, skipping caption parse');
+      captionPromise = Promise.resolve({ title: null, ingredients: [], instructions: [] });
     }
 
     // STEP 2: Parse VIDEO for thumbnail timestamp + fallback data (expensive video call)
     console.log('[Internal Import] Step 2: Extracting from video (for thumbnail timestamp)...');
+    const videoPromise = extractRecipeFromVideo(videoUrl, creatorUsername ? `Recipe from @${creatorUsername}` : undefined);
+
+    let captionData;
     let recipe;
     try {
-      recipe = await extractRecipeFromVideo(videoUrl, creatorUsername ? `Recipe from @${creatorUsername}` : undefined);
+      [captionData, recipe] = await Promise.all([captionPromise, videoPromise]);
       console.log(`[Internal Import] Video extracted: "${recipe.title}"`);
     } catch (error: any) {
       console.error('[Internal Import] Video extraction failed:', error.message);
@@ -187,17 +193,21 @@ export async function POST(request: NextRequest) {
     console.log(`[Internal Import] Final ingredients: ${finalIngredients.length} (from ${captionData.ingredients.length > 0 ? 'caption' : 'video'})`);
     console.log(`[Internal Import] Final instructions: ${finalInstructions.length} (from ${captionData.instructions.length > 0 ? 'caption' : 'video'})`)
 
-    // Step 2: Upload video to Mux
-    let muxData = null;
-    try {
-      console.log('[Internal Import] Uploading video to Mux...');
-      muxData = await uploadVideoFromUrl(videoUrl, {
-        passthrough: `scraper:${creatorUsername || Date.now()}`,
+    // Upload video to Mux in the background - only started once extraction succeeded, so a
+    // failed import never leaves an orphaned asset. Nothing needs muxData until the thumbnail
+    // is built, so asset creation overlaps segmentation. Never rejects.
+    console.log('[Internal Import] Uploading video to Mux...');
+    const muxUpload = uploadVideoFromUrl(videoUrl, {
+      passthrough: `scraper:${creatorUsername || Date.now()}`,
+    })
+      .then((data) => {
+        console.log(`[Internal Import] Mux upload complete: ${data.playbackId}`);
+        return data;
+      })
+      .catch((error: any) => {
+        console.warn('[Internal Import] Mux upload failed (continuing without video hosting):', error.message);
+        return null;
       });
-      console.log(`[Internal Import] Mux upload complete: ${muxData.playbackId}`);
-    } catch (error: any) {
-      console.warn('[Internal Import] Mux upload failed (continuing without video hosting):', error.message);
-    }
 
     // Step 3: Analyze video segments for step-by-step mode (uses final instructions)
     let videoSegments;
@@ -212,6 +222,9 @@ export async function POST(request: NextRequest) {
       }
     }
 
+    // Collect the Mux upload started alongside video extraction
+    const muxData = await muxUpload;
+
     // Generate thumbnail URL
     let thumbnailUrl;
     if (muxData?.playbackId) {
@@ -26,6 +26,7 @@
  *
  * Error Handling:
  * - Network errors (HikerAPI unreachable)
+ * - HikerAPI rate limits (429 opens a local cooldown so follow-up imports fail fast)
  * - Instagram errors (private account, deleted post)
  * - Video download timeouts (30 second limit)
  * - AI extraction errors (invalid JSON, missing fields)
@@ -41,7 +42,9 @@ import {
   extractYouTubeVideoId,
   parseYouTubeDescription,
   isYouTubeUrl,
-  isInstagramUrl
+  isInstagramUrl,
+  isInstagramCdnUrl,
+  extractInstagramShortcode
 } from '@/lib/youtube-parser';
 import { formatRecipeWithGPT } from '@/lib/openai-formatter';
 import { extractPinterestPin, isPinterestUrl } from '@/lib/pinterest-extractor';
@@ -113,13 +116,34 @@ interface ParsedRecipe {
   thumbnailTime?: number; // Best timestamp (seconds) for thumbnail from Gemini
 }
 
+// Short-lived cache of HikerAPI results keyed by shortcode. Module state survives
+// across requests on a warm instance, so retries and re-imports of the same reel
+// skip the HikerAPI call. TTL stays short because the returned video URLs are signed.
+const INSTAGRAM_CACHE_TTL_MS = 10 * 60 * 1000;
+const INSTAGRAM_CACHE_MAX_ENTRIES = 2048;
+const instagramDataCache = new Map<string, { data: InstagramExtractionResult; expiresAt: number }>();
+
+// HikerAPI fetches currently in progress, keyed by shortcode. Concurrent imports of the
+// same reel (double-clicks, client retries) await the first fetch instead of starting their own.
+const inflightInstagramFetches = new Map<string, Promise<InstagramExtractionResult>>();
+
+// Local circuit breaker for HikerAPI rate limits. After a 429 we fail fast until the
+// cooldown passes instead of spending round-trips on requests that will be rejected.
+const HIKER_API_DEFAULT_COOLDOWN_MS = 60 * 1000;
+const HIKER_API_MAX_COOLDOWN_MS = 5 * 60 * 1000; // Cap so a huge Retry-After can't block imports for hours
+let hikerApiCooldownUntil = 0;
+
 /**
  * Step 1: Extract Instagram data using HikerAPI
  *
  * Calls HikerAPI (instagrapi fork) to fetch Instagram media data.
  * HikerAPI provides direct video URLs, captions, and metadata via REST API.
  *
+ * Successful results are cached per shortcode for INSTAGRAM_CACHE_TTL_MS (errors are not cached),
+ * and concurrent calls for the same shortcode share a single HikerAPI request.
+ *
  * @param url - Instagram URL (e.g., https://www.instagram.com/reel/ABC123/ or /p/ABC123/)
+ * @param shortcode - Shortcode already parsed from the URL by the caller (parsed here if omitted)
  * @returns Promise<InstagramExtractionResult> - Caption, video URLs, thumbnails
  * @throws Error if HikerAPI is unreachable or Instagram fetch fails
  *
@@ -135,13 +159,62 @@ interface ParsedRecipe {
  *   }
  * }
  */
-async function extractInstagramData(url: string): Promise<InstagramExtractionResult> {
+async function extractInstagramData(
+  url: string,
+  shortcode: string | null = extractInstagramShortcode(url)
+): Promise<InstagramExtractionResult> {
+  const cached = shortcode ? instagramDataCache.get(shortcode) : undefined;
+  if (cached) {
+    if (cached.expiresAt > Date.now()) {
+      console.log(`[Instagram Import] Cache hit for shortcode: ${shortcode}`);
+      return { ...cached.data, postUrl: url };
+    }
+    instagramDataCache.delete(shortcode!);
+  }
+
+  if (!shortcode) {
+    return fetchInstagramDataFromHikerApi(url, null);
+  }
+
+  const inflight = inflightInstagramFetches.get(shortcode);
+  if (inflight) {
+    console.log(`[Instagram Import] Joining in-flight HikerAPI fetch for shortcode: ${shortcode}`);
+    return { ...(await inflight), postUrl: url };
+  }
+
+  const fetchPromise = fetchInstagramDataFromHikerApi(url, shortcode);
+  inflightInstagramFetches.set(shortcode, fetchPromise);
+  try {
+    return await fetchPromise;
+  } finally {
+    inflightInstagramFetches.delete(shortcode);
+  }
+}
+
+/**
+ * Perform the HikerAPI request for extractInstagramData and cache a successful result
+ *
+ * @param url - Instagram URL passed through to HikerAPI
+ * @param shortcode - Cache key for the result (null skips caching)
+ * @returns Promise<InstagramExtractionResult> - Caption, video URLs, thumbnails
+ * @throws Error if HikerAPI is unreachable, rate limited, or Instagram fetch fails
+ */
+async function fetchInstagramDataFromHikerApi(
+  url: string,
+  shortcode: string | null
+): Promise<InstagramExtractionResult> {
   const apiKey = process.env.HIKER_API_KEY;
 
   if (!apiKey) {
     throw new Error('HikerAPI key not configured (HIKER_API_KEY). Get your key at https://hikerapi.com');
   }
 
+  const cooldownRemainingMs = hikerApiCooldownUntil - Date.now();
+  if (cooldownRemainingMs > 0) {
+    console.warn(`[HikerAPI] Skipping request - rate limit cooldown active for ${Math.ceil(cooldownRemainingMs / 1000)}s`);
+    throw new Error(`HikerAPI rate limit exceeded - please try again in ${Math.ceil(cooldownRemainingMs / 1000)} seconds`);
+  }
+
   console.log(`[Instagram Import] Using HikerAPI for URL: ${url}`);
 
   // Use /v1/media/by/url endpoint which accepts full Instagram URLs
@@ -166,6 +239,16 @@ async function extractInstagramData(url: string): Promise<InstagramExtractionRes
       throw new Error('HikerAPI: Invalid or expired API key. Please get a new key from https://hikerapi.com/login');
     }
 
+    if (response.status === 429) {
+      // Retry-After may be absent or an HTTP date - fall back to the default cooldown
+      const retryAfterSeconds = Number(response.headers.get('retry-after'));
+      const cooldownMs = retryAfterSeconds > 0
+        ? Math.min(retryAfterSeconds * 1000, HIKER_API_MAX_COOLDOWN_MS)
+        : HIKER_API_DEFAULT_COOLDOWN_MS;
+      hikerApiCooldownUntil = Date.now() + cooldownMs;
+      throw new Error(`HikerAPI rate limit exceeded - please try again in ${Math.ceil(cooldownMs / 1000)} seconds`);
+    }
+
     throw new Error(`HikerAPI error (${response.status}): ${errorText}`);
   }
 
@@ -175,7 +258,7 @@ async function extractInstagramData(url: string): Promise<InstagramExtractionRes
   console.log('[HikerAPI] Caption length:', data.caption_text?.length || 0);
 
   // Map HikerAPI response to our format
-  return {
+  const result: InstagramExtractionResult = {
     success: true,
     caption: data.caption_text || '',
     comments: [],
@@ -185,6 +268,17 @@ async function extractInstagramData(url: string): Promise<InstagramExtractionRes
     username: data.user?.username || '',
     mediaType: data.media_type === 2 ? 'video' : 'photo',
   };
+
+  if (shortcode) {
+    if (instagramDataCache.size >= INSTAGRAM_CACHE_MAX_ENTRIES) {
+      // Map iterates in insertion order - evict the oldest entry
+      const oldestKey = instagramDataCache.keys().next().value;
+      if (oldestKey !== undefined) instagramDataCache.delete(oldestKey);
+    }
+    instagramDataCache.set(shortcode, { data: result, expiresAt: Date.now() + INSTAGRAM_CACHE_TTL_MS });
+  }
+
+  return result;
 }
 
 /**
@@ -787,16 +881,15 @@ export async function POST(request: NextRequest) {
     }
 
     // Detect URL type
-    console.log(`[Video Import] === URL Validation Debug ===`);
-    console.log(`[Video Import] Raw URL:`, url);
-    console.log(`[Video Import] URL type:`, typeof url);
-    console.log(`[Video Import] URL length:`, url?.length);
-    console.log(`[Video Import] Is CDN URL (lookaside check):`, url?.includes('lookaside.fbsbx.com'));
-    console.log(`[Video Import] Is CDN URL (full path check):`, url?.includes('lookaside.fbsbx.com/ig_messaging_cdn'));
-    const isInstagram = isInstagramUrl(url);
+    // Parse the shortcode first - a match already proves it's an Instagram post URL,
+    // so the remaining checks only run for stories/CDN links
+    const instagramShortcode = extractInstagramShortcode(url);
+    // Facebook CDN links (reels shared via DM webhooks) are fetched server-side, so only
+    // accept the anchored lookaside.fbsbx.com host - guards against SSRF via lookalike URLs
+    const isCdnUrl = instagramShortcode === null && isInstagramCdnUrl(url);
+    const isInstagram = instagramShortcode !== null || isCdnUrl || isInstagramUrl(url);
     const isYouTube = isYouTubeUrl(url);
     const isPinterest = isPinterestUrl(url);
-    console.log(`[Video Import] Validation results - isInstagram:`, isInstagram, 'isYouTube:', isYouTube, 'isPinterest:', isPinterest);
 
     // YouTube is temporarily disabled
     if (isYouTube) {
@@ -806,12 +899,11 @@ export async function POST(request: NextRequest) {
       );
     }
 
-    // TEMPORARY: Force-accept Facebook CDN URLs for debugging
-    const isCdnUrl = url.includes('lookaside.fbsbx.com/ig_messaging_cdn');
-    console.log(`[Video Import] Is CDN URL:`, isCdnUrl);
+    // One summary line per request (the URL itself is logged once the import starts)
+    console.log(`[Video Import] URL validation - isInstagram: ${isInstagram}, isPinterest: ${isPinterest}, isCdnUrl: ${isCdnUrl}`);
 
-    if (!isInstagram && !isPinterest && !isCdnUrl) {
-      console.log(`[Video Import] ❌ URL validation failed - rejecting URL`);
+    if (!isInstagram && !isPinterest) {
+      console.log(`[Video Import] ❌ URL validation failed - rejecting URL: ${url}`);
       return NextResponse.json(
         { error: 'Invalid URL - must be Instagram or Pinterest URL' },
         { status: 400 }
@@ -821,7 +913,7 @@ export async function POST(request: NextRequest) {
     console.log(`[Video Import] ✅ URL validation passed`);
 
     // Determine platform (CDN URLs are Instagram)
-    const platform = isPinterest ? 'Pinterest' : ((isInstagram || isCdnUrl) ? 'Instagram' : 'YouTube');
+    const platform = isPinterest ? 'Pinterest' : (isInstagram ? 'Instagram' : 'YouTube');
     console.log(`\n[${platform} Import] Starting import for: ${url}`);
 
     // Step 1: Extract data based on platform
@@ -847,7 +939,7 @@ export async function POST(request: NextRequest) {
       console.log(`[Pinterest Import] Description length: ${description?.length || 0} chars`);
       console.log(`[Pinterest Import] External link: ${pinterestData.link || 'none'}`);
       console.log(`[Pinterest Import] Domain: ${pinterestData.domain || 'none'}`);
-    } else if (isInstagram || isCdnUrl) {
+    } else if (isInstagram) {
       // Process Instagram URLs (including CDN URLs from webhooks)
       if (isCdnUrl) {
         // CDN URL is already a direct video link - skip HikerAPI
@@ -857,7 +949,7 @@ export async function POST(request: NextRequest) {
         description = 'Instagram reel shared via DM';
       } else {
         // Regular Instagram URL - extract data using HikerAPI
-        const instagramData = await extractInstagramData(url);
+        const instagramData = await extractInstagramData(url, instagramShortcode);
 
         videoUrl = instagramData.videoUrl;
         thumbnailUrl = instagramData.thumbnailUrl;
@@ -881,42 +973,42 @@ export async function POST(request: NextRequest) {
     }
 
     // Step 2: Upload to Mux (YouTube download disabled - only Instagram/Pinterest supported)
-    let muxData = null;
+    let muxData: Awaited<ReturnType<typeof uploadVideoFromUrl>> | null = null;
     let downloadedVideoUrl = videoUrl; // Default to original URL
 
     // YouTube download disabled - frontend blocks YouTube URLs
     // Only Instagram and Pinterest are currently supported
 
     // Upload to Mux for hosting (works for Instagram, YouTube, and Pinterest video pins)
+    // Not awaited here - asset creation runs in the background while Step 3 extracts
+    // the recipe, and is collected before Step 4. Never rejects.
+    let muxUpload: Promise<Awaited<ReturnType<typeof uploadVideoFromUrl>> | null> = Promise.resolve(null);
     if (downloadedVideoUrl) {
-      try {
-        console.log(`[${platform} Import] Uploading video to Mux...`);
-
-        // Extract a short identifier for passthrough (max 255 chars)
-        let passthrough = '';
-        if (isPinterest) {
-          passthrough = `pinterest:${pinterestData?.pinId}`;
-        } else if (isYouTube) {
-          passthrough = `youtube:${videoId}`;
-        } else {
-          // For Instagram CDN URLs, extract just the asset_id
-          const assetIdMatch = downloadedVideoUrl.match(/asset_id=(\d+)/);
-          const assetId = assetIdMatch ? assetIdMatch[1] : Date.now().toString();
-          passthrough = `instagram:${assetId}`;
-        }
-
-        muxData = await uploadVideoFromUrl(downloadedVideoUrl, { passthrough });
-        console.log(`[${platform} Import] ✅ Mux upload complete: ${muxData.playbackId}`);
-
-        // Use Mux thumbnail if we don't have one yet
-        if (!thumbnailUrl && muxData.playbackId) {
-          thumbnailUrl = `https://image.mux.com/${muxData.playbackId}/thumbnail.jpg`;
-          console.log(`[${platform} Import] Using Mux thumbnail: ${thumbnailUrl}`);
-        }
-      } catch (error: any) {
-        console.error(`[${platform} Import] ⚠️ Mux upload failed:`, error.message);
-        // Continue without Mux - will use original video URL as fallback
+      console.log(`[${platform} Import] Uploading video to Mux...`);
+
+      // Extract a short identifier for passthrough (max 255 chars)
+      let passthrough = '';
+      if (isPinterest) {
+        passthrough = `pinterest:${pinterestData?.pinId}`;
+      } else if (isYouTube) {
+        passthrough = `youtube:${videoId}`;
+      } else {
+        // For Instagram CDN URLs, extract just the asset_id
+        const assetIdMatch = downloadedVideoUrl.match(/asset_id=(\d+)/);
+        const assetId = assetIdMatch ? assetIdMatch[1] : Date.now().toString();
+        passthrough = `instagram:${assetId}`;
       }
+
+      muxUpload = uploadVideoFromUrl(downloadedVideoUrl, { passthrough })
+        .then((data) => {
+          console.log(`[${platform} Import] ✅ Mux upload complete: ${data.playbackId}`);
+          return data;
+        })
+        .catch((error: any) => {
+          console.error(`[${platform} Import] ⚠️ Mux upload failed:`, error.message);
+          // Continue without Mux - will use original video URL as fallback
+          return null;
+        });
     }
 
     // Step 3: Extract recipe (different flow for each platform)
@@ -1075,6 +1167,16 @@ export async function POST(request: NextRequest) {
       if (captionUrls.length > 0) {
         console.log(`[Instagram Import] Found ${captionUrls.length} URLs in caption, trying website extraction...`);
 
+        // Website extraction uses the thumbnail as its fallback image. When HikerAPI gave none
+        // (or this is a CDN URL), wait for the background Mux upload so its thumbnail stands in.
+        if (!thumbnailUrl) {
+          const uploadedMuxData = await muxUpload;
+          if (uploadedMuxData?.playbackId) {
+            thumbnailUrl = `https://image.mux.com/${uploadedMuxData.playbackId}/thumbnail.jpg`;
+            console.log(`[${platform} Import] Using Mux thumbnail: ${thumbnailUrl}`);
+          }
+        }
+
         for (const captionUrl of captionUrls.slice(0, 3)) { // Try up to 3 URLs
           console.log(`[Instagram Import] Trying URL: ${captionUrl}`);
           try {
@@ -1160,6 +1262,17 @@ export async function POST(request: NextRequest) {
       recipe = instagramRecipe;
     }
 
+    // Step 3b: Collect the Mux upload started in Step 2
+    // (a Pinterest video fallback may already have uploaded its own asset - keep that one)
+    const backgroundMuxData = await muxUpload;
+    muxData = muxData ?? backgroundMuxData;
+
+    // Use Mux thumbnail if we don't have one yet
+    if (!thumbnailUrl && muxData?.playbackId) {
+      thumbnailUrl = `https://image.mux.com/${muxData.playbackId}/thumbnail.jpg`;
+      console.log(`[${platform} Import] Using Mux thumbnail: ${thumbnailUrl}`);
+    }
+
     // Step 4: Use segments from combined extraction (no separate API call needed!)
     let videoSegments: VideoSegment[] | undefined = videoSegmentsFromExtraction;
     if (videoSegments && videoSegments.length > 0) {
@@ -223,6 +223,17 @@ export function isYouTubeUrl(url: string): boolean {
   return youtubePatterns.some(pattern => pattern.test(url));
 }
 
+// Compiled once at module load instead of on every call
+const INSTAGRAM_SHORTCODE_PATTERN = /^https?:\/\/(?:www\.)?instagram\.com\/(?:reel|p|tv)\/([A-Za-z0-9_-]+)/i;
+
+const INSTAGRAM_CDN_PATTERN = /^https?:\/\/lookaside\.fbsbx\.com\/ig_messaging_cdn\/\?asset_id=/i; // Facebook CDN URLs
+
+const INSTAGRAM_URL_PATTERNS = [
+  INSTAGRAM_SHORTCODE_PATTERN,
+  /^https?:\/\/(www\.)?instagram\.com\/stories\/[^/]+\/\d+/i,
+  INSTAGRAM_CDN_PATTERN,
+];
+
 /**
  * Detect if a URL is from Instagram
  *
@@ -238,12 +249,35 @@ export function isYouTubeUrl(url: string): boolean {
  * @returns true if Instagram URL
  */
 export function isInstagramUrl(url: string): boolean {
-  const instagramPatterns = [
-    /^https?:\/\/(www\.)?instagram\.com\/(reel|p|tv)\/[A-Za-z0-9_-]+/i,
-    /^https?:\/\/(www\.)?instagram\.com\/stories\/[^/]+\/\d+/i,
-    /^https?:\/\/lookaside\.fbsbx\.com\/ig_messaging_cdn\/\?asset_id=/i, // Facebook CDN URLs
-  ];
+  return INSTAGRAM_URL_PATTERNS.some(pattern => pattern.test(url));
+}
+
+/**
+ * Detect if a URL is a Facebook CDN video link (Instagram reels shared via DM webhooks)
+ *
+ * Anchored to the lookaside.fbsbx.com host so a lookalike path in another
+ * host's URL or query string is rejected - these URLs are fetched server-side.
+ *
+ * @param url - Any URL string
+ * @returns true if Facebook CDN URL
+ */
+export function isInstagramCdnUrl(url: string): boolean {
+  return INSTAGRAM_CDN_PATTERN.test(url);
+}
 
-  return instagramPatterns.some(pattern => pattern.test(url));
+/**
+ * Extract the media shortcode from an Instagram post/reel/tv URL
+ *
+ * Handles:
+ * - https://www.instagram.com/reel/CODE/
+ * - https://instagram.com/p/CODE/?igsh=...
+ * - https://www.instagram.com/tv/CODE
+ *
+ * @param url - Instagram URL
+ * @returns Shortcode or null if not a post/reel/tv URL (stories and CDN URLs return null)
+ */
+export function extractInstagramShortcode(url: string): string | null {
+  const match = INSTAGRAM_SHORTCODE_PATTERN.exec(url);
+  return match ? match[1] : null;
 }
 